@@ -11,42 +11,54 @@ Exit codes:
 """
 
 import sys
-import argparse
-import os
 
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from state_manager_readonly import get_manager
 
-from state_manager import get_manager
+# Banner borders as module constants; the blocked banner is consumed by
+# Claude, so it is always printed, but the borders need not be rebuilt
+_BORDER = "=" * 64
+_RULE = "-" * 64
+
+# Action -> StateManager validation method; one dict lookup replaces the
+# if/elif chain in main and doubles as the set of valid actions
+_DISPATCH = {
+    "edit": "can_edit_code",
+    "commit": "can_commit",
+    "push": "can_push",
+    "implement": "can_edit_code",
+}
+
+
+def parse_action(argv: list) -> str:
+    """Extract --action from argv without argparse.
+
+    argparse pulls in gettext and builds a parser object for what is a
+    single required flag; this hook runs before every gated tool use, so
+    the cold-start cost matters. Accepts both '--action edit' and
+    '--action=edit' (settings.local.json uses the latter).
+    """
+    for i, arg in enumerate(argv):
+        if arg == "--action" and i + 1 < len(argv):
+            return argv[i + 1]
+        if arg.startswith("--action="):
+            return arg.split("=", 1)[1]
+    return ""
 
 
 def main():
-    parser = argparse.ArgumentParser(description="Validate VibeCode step constraints")
-    parser.add_argument(
-        "--action",
-        choices=["edit", "commit", "push", "implement"],
-        required=True,
-        help="The action being validated"
-    )
-    args = parser.parse_args()
+    action = parse_action(sys.argv[1:])
+    if action not in _DISPATCH:
+        print(f"usage: check-step-validation.py --action {{{','.join(_DISPATCH)}}}", file=sys.stderr)
+        sys.exit(2)
 
     manager = get_manager()
 
     # Dispatch to appropriate validation
-    if args.action == "edit":
-        allowed, reason = manager.can_edit_code()
-    elif args.action == "commit":
-        allowed, reason = manager.can_commit()
-    elif args.action == "push":
-        allowed, reason = manager.can_push()
-    elif args.action == "implement":
-        allowed, reason = manager.can_edit_code()
-    else:
-        allowed, reason = False, f"Unknown action: {args.action}"
+    allowed, reason = getattr(manager, _DISPATCH[action])()
 
     if allowed:
         # Action is allowed
-        print(f"[OK] VibeCode: {args.action} allowed at Step {manager.get_current_step()}")
+        print(f"[OK] VibeCode: {action} allowed at Step {manager.get_current_step()}")
         sys.exit(0)
     else:
         # Action is blocked - print error and exit with code 1
@@ -54,17 +66,17 @@ def main():
         step_info = manager.get_step_info(step)
 
         print(f"""
-================================================================
+{_BORDER}
            [BLOCKED] VIBECODE WORKFLOW GATE
-================================================================
-Action: {args.action}
-Current Step: {step} - {step_info['name']}
-----------------------------------------------------------------
+{_BORDER}
+Action: {action}
+Current Step: {step} - {step_info.name}
+{_RULE}
 REASON: {reason}
-----------------------------------------------------------------
+{_RULE}
 To proceed, complete the required workflow steps first.
 Use TaskList to check current progress.
-================================================================
+{_BORDER}
 """)
         sys.exit(1)
 
@@ -5,7 +5,9 @@ Central configuration for all enforcement scripts.
 """
 
 import os
+from dataclasses import dataclass
 from pathlib import Path
+from types import MappingProxyType
 
 # Base paths
 PROJECT_ROOT = Path(__file__).parent.parent.parent
@@ -22,113 +24,53 @@ BACKUP_DIR = WORK_DIR / "backups"
 PLAN_FILE = WORKFLOWS_DIR / "vibe-plan.md"
 CONTEXT_PACK_FILE = WORKFLOWS_DIR / "context-pack.md"
 
-# Step definitions with validation requirements
-STEPS = {
-    0: {
-        "name": "Problem Statement",
-        "required_artifacts": [],
-        "gate": "none",
-        "allows_code_edit": False
-    },
-    1: {
-        "name": "Discovery Q&A",
-        "required_artifacts": [],
-        "gate": "none",
-        "allows_code_edit": False
-    },
-    2: {
-        "name": "Write spec.md",
-        "required_artifacts": ["spec.md"],
-        "gate": "user_approval",
-        "allows_code_edit": False
-    },
-    3: {
-        "name": "Generate plan.md",
-        "required_artifacts": ["plan.md"],
-        "gate": "subagent_critique",
-        "allows_code_edit": False
-    },
-    4: {
-        "name": "Plan Critique",
-        "required_artifacts": [],
-        "gate": "none",
-        "allows_code_edit": False
-    },
-    5: {
-        "name": "Rules & Guardrails",
-        "required_artifacts": ["rules.md"],
-        "gate": "none",
-        "allows_code_edit": False
-    },
-    6: {
-        "name": "Select Bead/Task",
-        "required_artifacts": [],
-        "gate": "task_selected",
-        "allows_code_edit": False
-    },
-    7: {
-        "name": "Context Packing",
-        "required_artifacts": ["context-pack.md"],
-        "gate": "context_exists",
-        "allows_code_edit": False
-    },
-    8: {
-        "name": "Implementation",
-        "required_artifacts": [],
-        "gate": "context_pack_verified",
-        "allows_code_edit": True  # First step that allows code edits
-    },
-    9: {
-        "name": "Run Tests/Checks",
-        "required_artifacts": [],
-        "gate": "tests_pass",
-        "allows_code_edit": True
-    },
-    10: {
-        "name": "GREEN Check",
-        "required_artifacts": [],
-        "gate": "all_green",
-        "allows_code_edit": True
-    },
-    11: {
-        "name": "Debug Loop",
-        "required_artifacts": [],
-        "gate": "none",
-        "allows_code_edit": True
-    },
-    12: {
-        "name": "Human Review",
-        "required_artifacts": [],
-        "gate": "human_approval",
-        "allows_code_edit": False
-    },
-    13: {
-        "name": "Second Model Review",
-        "required_artifacts": [],
-        "gate": "none",
-        "allows_code_edit": False
-    },
-    14: {
-        "name": "Commit",
-        "required_artifacts": [],
-        "gate": "human_approval_verified",
-        "allows_code_edit": False
-    },
-    15: {
-        "name": "Loop or Merge",
-        "required_artifacts": [],
-        "gate": "none",
-        "allows_code_edit": False
-    }
-}
+# Step definitions with validation requirements. Frozen + slotted so hot
+# hooks get C-level attribute access instead of dict hashing, and step
+# metadata can't be mutated at runtime.
+@dataclass(frozen=True, slots=True)
+class StepInfo:
+    name: str
+    required_artifacts: tuple
+    gate: str
+    allows_code_edit: bool
+
 
-# Temporal constraints (must happen before)
-TEMPORAL_CONSTRAINTS = {
+# Indexed by step number; hooks look steps up on every invocation
+STEPS = (
+    StepInfo("Problem Statement", (), "none", False),          # 0
+    StepInfo("Discovery Q&A", (), "none", False),              # 1
+    StepInfo("Write spec.md", ("spec.md",), "user_approval", False),       # 2
+    StepInfo("Generate plan.md", ("plan.md",), "subagent_critique", False),  # 3
+    StepInfo("Plan Critique", (), "none", False),              # 4
+    StepInfo("Rules & Guardrails", ("rules.md",), "none", False),          # 5
+    StepInfo("Select Bead/Task", (), "task_selected", False),  # 6
+    StepInfo("Context Packing", ("context-pack.md",), "context_exists", False),  # 7
+    StepInfo("Implementation", (), "context_pack_verified", True),  # 8: first step that allows code edits
+    StepInfo("Run Tests/Checks", (), "tests_pass", True),      # 9
+    StepInfo("GREEN Check", (), "all_green", True),            # 10
+    StepInfo("Debug Loop", (), "none", True),                  # 11
+    StepInfo("Human Review", (), "human_approval", False),     # 12
+    StepInfo("Second Model Review", (), "none", False),        # 13
+    StepInfo("Commit", (), "human_approval_verified", False),  # 14
+    StepInfo("Loop or Merge", (), "none", False),              # 15
+)
+
+def step_info(step: int) -> StepInfo:
+    """Look up a step's metadata, falling back to step 0 when out of range.
+
+    Plain tuple indexing; with STEPS immutable and 16 entries long this
+    is already cheaper than a memoization layer would be.
+    """
+    return STEPS[step] if 0 <= step < len(STEPS) else STEPS[0]
+
+
+# Temporal constraints (must happen before); read-only view
+TEMPORAL_CONSTRAINTS = MappingProxyType({
     "edit_code": {"min_step": 8, "requires": ["context_pack_exists"]},
     "commit": {"min_step": 14, "requires": ["tests_passed", "human_approved"]},
     "push": {"min_step": 15, "requires": ["committed"]},
     "implement": {"min_step": 8, "requires": ["context_pack_exists", "task_selected"]}
-}
+})
 
 # Default state template
 DEFAULT_STATE = {
@@ -7,12 +7,8 @@ every prompt, ensuring Claude never loses track of the current step.
 """
 
 import sys
-import os
 
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-
-from state_manager import get_manager
+from state_manager_readonly import get_manager
 
 
 def main():
@@ -21,7 +17,7 @@ def main():
     step_info = manager.get_step_info(step)
 
     # Output a compact reminder that will be injected into context
-    print(f"[VibeCode Step {step}: {step_info['name']}] Code edit: {'YES' if step_info['allows_code_edit'] else 'NO'}")
+    print(f"[VibeCode Step {step}: {step_info.name}] Code edit: {'YES' if step_info.allows_code_edit else 'NO'}")
 
     sys.exit(0)
 
@@ -9,12 +9,7 @@ PostToolUse hook that runs after code edits to:
 """
 
 import sys
-import os
 import json
-from datetime import datetime
-
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from state_manager import get_manager
 
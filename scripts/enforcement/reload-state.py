@@ -7,12 +7,8 @@ This ensures Claude always knows the current workflow position.
 """
 
 import sys
-import os
 from datetime import datetime
 
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-
 from state_manager import get_manager
 from config import CONTEXT_PACK_FILE
 
@@ -22,6 +18,7 @@ def main():
 
     # Update session start time
     manager.state["session"]["started_at"] = datetime.now().isoformat()
+    manager.touch()
 
     # Check if context-pack.md actually exists
     if CONTEXT_PACK_FILE.exists():
@@ -37,9 +34,9 @@ def main():
     step_info = manager.get_step_info(step)
 
     print(f"""
-[CURRENT TASK] Step {step} - {step_info['name']}
-   Gate: {step_info['gate']}
-   Code editing: {'ALLOWED' if step_info['allows_code_edit'] else 'NOT ALLOWED'}
+[CURRENT TASK] Step {step} - {step_info.name}
+   Gate: {step_info.gate}
+   Code editing: {'ALLOWED' if step_info.allows_code_edit else 'NOT ALLOWED'}
 
 [TIP] Use TaskList to see all workflow tasks and their status.
 """)
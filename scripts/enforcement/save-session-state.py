@@ -10,9 +10,6 @@ import sys
 import os
 from datetime import datetime
 
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-
 from state_manager import get_manager
 
 
@@ -24,16 +21,21 @@ def main():
 
     # Update session metadata
     manager.state["session"]["ended_at"] = datetime.now().isoformat()
+    manager.touch()
     manager.save()
 
-    print(f"""
-================================================================
+    # Banner is informational only; skip the string formatting unless
+    # someone is actually watching
+    if sys.stdout.isatty() or os.environ.get("VIBE_VERBOSE"):
+        border = "=" * 64
+        print(f"""
+{border}
             VIBECODE SESSION STATE SAVED
-================================================================
+{border}
 Final Step: {manager.get_current_step()}
 Bead: {manager.state.get('current_bead_id', 'None')}
 State will be restored on next session start.
-================================================================
+{border}
 """)
 
     sys.exit(0)
@@ -11,9 +11,6 @@ import sys
 import os
 from datetime import datetime
 
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-
 from state_manager import get_manager
 
 
@@ -25,19 +22,25 @@ def main():
 
     # Log the compaction event
     manager.state["session"]["last_compact"] = datetime.now().isoformat()
+    manager.touch()
     manager.save()
 
-    print(f"""
-================================================================
+    # Banner is informational only; skip the string formatting unless
+    # someone is actually watching
+    if sys.stdout.isatty() or os.environ.get("VIBE_VERBOSE"):
+        border = "=" * 64
+        rule = "-" * 64
+        print(f"""
+{border}
             VIBECODE STATE SAVED (PRE-COMPACT)
-================================================================
+{border}
 Backup: {str(backup_path) if backup_path else 'None'}
 Step: {manager.get_current_step()}
 Bead: {manager.state.get('current_bead_id', 'None')}
-----------------------------------------------------------------
+{rule}
 State will be reloaded at next session start.
 Use `reload-state.py` to manually restore if needed.
-================================================================
+{border}
 """)
 
     sys.exit(0)
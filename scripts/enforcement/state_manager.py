@@ -1,67 +1,100 @@
 """
 VibeCode State Manager
 
-Handles reading, writing, and validating workflow state.
+Read/write manager for workflow state: mutation, persistence, backups
+and history logging on top of the query layer in state_manager_readonly.
+Hooks that only read state should import from state_manager_readonly
+instead to keep their cold start lean.
 """
 from __future__ import annotations
 
-import json
 import os
 from datetime import datetime
-from pathlib import Path
-from typing import Optional, Tuple
+from typing import Optional
 import shutil
 
-from config import (
-    STATE_FILE, HISTORY_FILE, BACKUP_DIR, DEFAULT_STATE,
-    STEPS, TEMPORAL_CONSTRAINTS, CONTEXT_PACK_FILE
+from config import STATE_FILE, HISTORY_FILE, BACKUP_DIR
+from state_manager_readonly import (
+    ReadOnlyStateManager, _dumps, _dumps_indented
 )
 
+# Max history entries kept in vibe-state.json; HISTORY_FILE keeps everything
+MAX_STATE_HISTORY = 200
 
-class StateManager:
+
+class StateManager(ReadOnlyStateManager):
     """Manages persistent workflow state for VibeCode Lifecycle."""
 
     def __init__(self):
+        super().__init__()
         self._ensure_directories()
-        self.state = self._load_state()
+        self._pending_history: list[bytes] = []
+        self._dirty = False
+        self._now: Optional[str] = None
+
+    @ReadOnlyStateManager.state.setter
+    def state(self, value: dict):
+        self._state = value
+        self._dirty = True
+
+    def _now_iso(self) -> str:
+        """ISO timestamp for state mutations, computed once per process.
+
+        Hook processes live for milliseconds; each datetime.now().isoformat()
+        call pays tz resolution plus string formatting, and sub-second
+        variance between mutations in one run carries no information.
+        """
+        if self._now is None:
+            self._now = datetime.now().isoformat()
+        return self._now
+
+    def touch(self):
+        """Mark state as modified so the next save() actually writes.
+
+        Use after mutating self.state directly (e.g. session timestamps)
+        rather than through a setter.
+        """
+        self._dirty = True
 
     def _ensure_directories(self):
         """Create necessary directories if they don't exist."""
         STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
         BACKUP_DIR.mkdir(parents=True, exist_ok=True)
 
-    def _load_state(self) -> dict:
-        """Load state from file or create default."""
-        if STATE_FILE.exists():
-            try:
-                with open(STATE_FILE, 'r') as f:
-                    state = json.load(f)
-                # Merge with defaults to handle new fields
-                merged = {**DEFAULT_STATE, **state}
-                return merged
-            except json.JSONDecodeError:
-                return DEFAULT_STATE.copy()
-        return DEFAULT_STATE.copy()
-
     def save(self):
-        """Save current state to file."""
-        self.state["session"]["last_activity"] = datetime.now().isoformat()
-        with open(STATE_FILE, 'w') as f:
-            json.dump(self.state, f, indent=2)
+        """Save current state to file. No-op when nothing changed."""
+        if not self._dirty:
+            return
+        self.state["session"]["last_activity"] = self._now_iso()
+        # Write-then-rename so a crash mid-write can't leave a truncated
+        # state file (which _load_state would silently reset to defaults)
+        tmp_path = STATE_FILE.with_suffix('.json.tmp')
+        with open(tmp_path, 'wb') as f:
+            f.write(_dumps_indented(self.state))
+        os.replace(tmp_path, STATE_FILE)
+        self._dirty = False
+
+        # Flush buffered history entries to the JSONL file in one write
+        if self._pending_history:
+            with open(HISTORY_FILE, 'ab') as f:
+                f.write(b"".join(self._pending_history))
+            self._pending_history.clear()
 
     def backup(self, reason: str = "manual"):
         """Create a backup of current state."""
         if STATE_FILE.exists():
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             backup_path = BACKUP_DIR / f"vibe-state_{timestamp}_{reason}.json"
-            shutil.copy(STATE_FILE, backup_path)
+            # Hardlink is zero-copy; save() replaces STATE_FILE with a new
+            # inode, so the linked backup is never touched by later writes.
+            # Fall back to a copy on Windows or cross-filesystem setups.
+            try:
+                os.link(STATE_FILE, backup_path)
+            except OSError:
+                shutil.copy(STATE_FILE, backup_path)
             return backup_path
         return None
 
-    def get_current_step(self) -> int:
-        """Get the current workflow step."""
-        return self.state.get("current_step", 0)
-
     def set_current_step(self, step: int):
         """Set the current workflow step."""
         if 0 <= step <= 15:
@@ -70,142 +103,49 @@ class StateManager:
             self._log_history(f"Step changed: {old_step} -> {step}")
             self.save()
 
-    def get_step_info(self, step: Optional[int] = None) -> dict:
-        """Get information about a specific step."""
-        step = step if step is not None else self.get_current_step()
-        return STEPS.get(step, STEPS[0])
-
-    def can_edit_code(self) -> tuple[bool, str]:
-        """Check if code editing is allowed in current step."""
-        step = self.get_current_step()
-        step_info = self.get_step_info(step)
-
-        if not step_info.get("allows_code_edit", False):
-            return False, f"Step {step} ({step_info['name']}) does not allow code editing. Must be Step 8+ (Implementation)."
-
-        # Check temporal constraints
-        constraints = TEMPORAL_CONSTRAINTS.get("edit_code", {})
-        min_step = constraints.get("min_step", 0)
-
-        if step < min_step:
-            return False, f"Code editing requires Step {min_step}+. Current: Step {step}"
-
-        # Check required conditions
-        for requirement in constraints.get("requires", []):
-            if requirement == "context_pack_exists":
-                if not self.state.get("context", {}).get("context_pack_exists", False):
-                    # Also check if file actually exists
-                    if not CONTEXT_PACK_FILE.exists():
-                        return False, "context-pack.md must exist before code editing (Step 7)"
-
-        return True, "OK"
-
-    def can_commit(self) -> tuple[bool, str]:
-        """Check if committing is allowed."""
-        step = self.get_current_step()
-
-        constraints = TEMPORAL_CONSTRAINTS.get("commit", {})
-        min_step = constraints.get("min_step", 14)
-
-        if step < min_step:
-            return False, f"Commit requires Step {min_step}+. Current: Step {step}"
-
-        # Check tests passed
-        if not self.state.get("verification", {}).get("tests_passed", False):
-            return False, "Tests must pass before commit (Step 9)"
-
-        # Check human approval
-        if not self.state.get("approvals", {}).get("human_review", False):
-            return False, "Human review approval required before commit (Step 12)"
-
-        return True, "OK"
-
-    def can_push(self) -> tuple[bool, str]:
-        """Check if pushing is allowed."""
-        step = self.get_current_step()
-
-        constraints = TEMPORAL_CONSTRAINTS.get("push", {})
-        min_step = constraints.get("min_step", 15)
-
-        if step < min_step:
-            return False, f"Push requires Step {min_step}. Current: Step {step}"
-
-        return True, "OK"
-
     def set_tests_passed(self, passed: bool):
         """Update test verification status."""
-        if "verification" not in self.state:
-            self.state["verification"] = {}
         self.state["verification"]["tests_passed"] = passed
-        self.state["verification"]["last_check"] = datetime.now().isoformat()
+        self.state["verification"]["last_check"] = self._now_iso()
+        self._dirty = True
         self.save()
 
     def set_human_approval(self, approved: bool):
         """Update human review approval status."""
-        if "approvals" not in self.state:
-            self.state["approvals"] = {}
         self.state["approvals"]["human_review"] = approved
         self._log_history(f"Human approval: {'granted' if approved else 'revoked'}")
         self.save()
 
     def set_context_pack_exists(self, exists: bool):
         """Update context pack existence status."""
-        if "context" not in self.state:
-            self.state["context"] = {}
         self.state["context"]["context_pack_exists"] = exists
+        self._dirty = True
         self.save()
 
     def set_task_selected(self, selected: bool, bead_id: Optional[str] = None):
         """Update task selection status."""
-        if "context" not in self.state:
-            self.state["context"] = {}
         self.state["context"]["task_selected"] = selected
         if bead_id:
             self.state["current_bead_id"] = bead_id
+        self._dirty = True
         self.save()
 
     def _log_history(self, message: str):
         """Add entry to history."""
-        if "history" not in self.state:
-            self.state["history"] = []
-
         entry = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": self._now_iso(),
             "message": message
         }
         self.state["history"].append(entry)
 
-        # Also append to JSONL file for durability
-        with open(HISTORY_FILE, 'a') as f:
-            f.write(json.dumps(entry) + "\n")
-
-    def get_state_summary(self) -> str:
-        """Get a human-readable state summary."""
-        step = self.get_current_step()
-        step_info = self.get_step_info(step)
-
-        ctx_pack = "YES" if self.state.get('context', {}).get('context_pack_exists') else "NO"
-        tests = "YES" if self.state.get('verification', {}).get('tests_passed') else "NO"
-        approval = "YES" if self.state.get('approvals', {}).get('human_review') else "NO"
-        code_edit = "YES" if step >= 8 else "NO"
-
-        summary = f"""
-================================================================
-                  VIBECODE WORKFLOW STATE
-================================================================
-Current Step: {step} - {step_info['name']}
-Bead ID: {self.state.get('current_bead_id', 'None')}
-----------------------------------------------------------------
-GATES:
-  - Context Pack:     {ctx_pack}
-  - Tests Passed:     {tests}
-  - Human Approval:   {approval}
-  - Code Edit Allowed: {code_edit}
-----------------------------------------------------------------
-Problem: {self.state.get('problem_statement', 'Not defined')[:50]}
-================================================================
-"""
-        return summary
+        # Keep the in-state history bounded so vibe-state.json doesn't
+        # grow without limit; the JSONL file remains the full audit log
+        if len(self.state["history"]) > MAX_STATE_HISTORY:
+            self.state["history"] = self.state["history"][-MAX_STATE_HISTORY:]
+
+        # Buffer the JSONL line; save() flushes the batch in one write
+        self._pending_history.append(_dumps(entry) + b"\n")
+        self._dirty = True
 
 
 # Singleton instance
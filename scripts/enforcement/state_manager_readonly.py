@@ -0,0 +1,207 @@
+"""
+VibeCode State Manager (read-only)
+
+Load-and-query side of the state manager, split out so high-frequency
+hooks that never mutate state (inject-current-step, check-step-validation)
+skip importing the write/backup/history machinery — and shutil with it —
+on every cold start. state_manager builds the full read/write manager on
+top of this.
+"""
+from __future__ import annotations
+
+import json
+from copy import deepcopy
+from typing import Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from config import (
+    STATE_FILE, DEFAULT_STATE,
+    TEMPORAL_CONSTRAINTS, CONTEXT_PACK_FILE, StepInfo, step_info
+)
+
+# JSON helpers: orjson is 3-5x faster for both parse and serialize and
+# emits bytes directly; fall back to stdlib json when unavailable.
+# Both raise ValueError subclasses on malformed input. The dump helpers
+# live here too so the orjson probe happens exactly once; only
+# state_manager uses them.
+if orjson is not None:
+    def _loads(data: bytes) -> dict:
+        return orjson.loads(data)
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+
+    def _dumps_indented(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+else:
+    def _loads(data: bytes) -> dict:
+        return json.loads(data)
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+    def _dumps_indented(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode("utf-8")
+
+
+# Banner borders, built once instead of inline in every f-string literal
+_BORDER = "=" * 64
+_RULE = "-" * 64
+
+
+def _deep_merge(defaults: dict, loaded: dict) -> dict:
+    """Recursively merge loaded state over defaults into a fresh dict.
+
+    A shallow {**defaults, **loaded} let nested dicts from disk replace
+    the default subtrees wholesale, so defaults added later never showed
+    up and every setter had to guard against missing keys. Defaults not
+    present in the loaded state are deep-copied so DEFAULT_STATE's nested
+    structures are never shared with live state.
+    """
+    merged = {}
+    for key, default in defaults.items():
+        if key not in loaded:
+            merged[key] = deepcopy(default)
+        elif isinstance(default, dict) and isinstance(loaded[key], dict):
+            merged[key] = _deep_merge(default, loaded[key])
+        else:
+            merged[key] = loaded[key]
+    for key, value in loaded.items():
+        if key not in defaults:
+            merged[key] = value
+    return merged
+
+
+class ReadOnlyStateManager:
+    """Loads and queries workflow state without any write capability."""
+
+    def __init__(self):
+        self._state: Optional[dict] = None
+
+    @property
+    def state(self) -> dict:
+        """Workflow state, loaded lazily on first access."""
+        if self._state is None:
+            self._state = self._load_state()
+        return self._state
+
+    def _load_state(self) -> dict:
+        """Load state from file or create default."""
+        if STATE_FILE.exists():
+            try:
+                with open(STATE_FILE, 'rb') as f:
+                    state = _loads(f.read())
+                # Merge with defaults to handle new fields
+                return _deep_merge(DEFAULT_STATE, state)
+            except ValueError:
+                return deepcopy(DEFAULT_STATE)
+        return deepcopy(DEFAULT_STATE)
+
+    def get_current_step(self) -> int:
+        """Get the current workflow step."""
+        return self.state.get("current_step", 0)
+
+    def get_step_info(self, step: Optional[int] = None) -> StepInfo:
+        """Get information about a specific step."""
+        step = step if step is not None else self.get_current_step()
+        return step_info(step)
+
+    def can_edit_code(self) -> tuple[bool, str]:
+        """Check if code editing is allowed in current step."""
+        step = self.get_current_step()
+        step_info = self.get_step_info(step)
+
+        if not step_info.allows_code_edit:
+            return False, f"Step {step} ({step_info.name}) does not allow code editing. Must be Step 8+ (Implementation)."
+
+        # Check temporal constraints
+        constraints = TEMPORAL_CONSTRAINTS.get("edit_code", {})
+        min_step = constraints.get("min_step", 0)
+
+        if step < min_step:
+            return False, f"Code editing requires Step {min_step}+. Current: Step {step}"
+
+        # Check required conditions
+        for requirement in constraints.get("requires", []):
+            if requirement == "context_pack_exists":
+                if not self.state.get("context", {}).get("context_pack_exists", False):
+                    # Also check if file actually exists
+                    if not CONTEXT_PACK_FILE.exists():
+                        return False, "context-pack.md must exist before code editing (Step 7)"
+
+        return True, "OK"
+
+    def can_commit(self) -> tuple[bool, str]:
+        """Check if committing is allowed."""
+        step = self.get_current_step()
+
+        constraints = TEMPORAL_CONSTRAINTS.get("commit", {})
+        min_step = constraints.get("min_step", 14)
+
+        if step < min_step:
+            return False, f"Commit requires Step {min_step}+. Current: Step {step}"
+
+        # Check tests passed
+        if not self.state.get("verification", {}).get("tests_passed", False):
+            return False, "Tests must pass before commit (Step 9)"
+
+        # Check human approval
+        if not self.state.get("approvals", {}).get("human_review", False):
+            return False, "Human review approval required before commit (Step 12)"
+
+        return True, "OK"
+
+    def can_push(self) -> tuple[bool, str]:
+        """Check if pushing is allowed."""
+        step = self.get_current_step()
+
+        constraints = TEMPORAL_CONSTRAINTS.get("push", {})
+        min_step = constraints.get("min_step", 15)
+
+        if step < min_step:
+            return False, f"Push requires Step {min_step}. Current: Step {step}"
+
+        return True, "OK"
+
+    def get_state_summary(self) -> str:
+        """Get a human-readable state summary."""
+        step = self.get_current_step()
+        step_info = self.get_step_info(step)
+
+        ctx_pack = "YES" if self.state.get('context', {}).get('context_pack_exists') else "NO"
+        tests = "YES" if self.state.get('verification', {}).get('tests_passed') else "NO"
+        approval = "YES" if self.state.get('approvals', {}).get('human_review') else "NO"
+        code_edit = "YES" if step >= 8 else "NO"
+
+        summary = f"""
+{_BORDER}
+                  VIBECODE WORKFLOW STATE
+{_BORDER}
+Current Step: {step} - {step_info.name}
+Bead ID: {self.state.get('current_bead_id', 'None')}
+{_RULE}
+GATES:
+  - Context Pack:     {ctx_pack}
+  - Tests Passed:     {tests}
+  - Human Approval:   {approval}
+  - Code Edit Allowed: {code_edit}
+{_RULE}
+Problem: {self.state.get('problem_statement', 'Not defined')[:50]}
+{_BORDER}
+"""
+        return summary
+
+
+# Singleton instance
+_manager: Optional[ReadOnlyStateManager] = None
+
+def get_manager() -> ReadOnlyStateManager:
+    """Get or create the singleton read-only StateManager instance."""
+    global _manager
+    if _manager is None:
+        _manager = ReadOnlyStateManager()
+    return _manager
@@ -7,12 +7,8 @@ Task system with VibeCode's workflow state.
 """
 
 import sys
-import os
 import json
-from datetime import datetime
-
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import re
 
 from state_manager import get_manager
 
@@ -40,18 +36,47 @@ TASK_TO_STEP = {
     "merge": 15,
 }
 
+# Precomputed at import so infer_step_from_task avoids per-call
+# dict.items() allocation and regex recompilation
+_KEYWORD_ITEMS = tuple(TASK_TO_STEP.items())
+_STEP_RE = re.compile(r'step\s*(\d+)')
+
+# Optional Aho-Corasick automaton: one linear scan over the subject
+# instead of one substring search per keyword. Values carry the keyword's
+# position in TASK_TO_STEP so ties resolve in the same order as the
+# plain scan below.
+try:
+    import ahocorasick
+
+    _AUTOMATON = ahocorasick.Automaton()
+    for _idx, (_keyword, _step) in enumerate(_KEYWORD_ITEMS):
+        _AUTOMATON.add_word(_keyword, (_idx, _step))
+    _AUTOMATON.make_automaton()
+except ImportError:
+    _AUTOMATON = None
+
+
+def _match_keyword(subject_lower: str):
+    """Find the first TASK_TO_STEP keyword in the subject, or None."""
+    if _AUTOMATON is not None:
+        best = min(
+            (value for _, value in _AUTOMATON.iter(subject_lower)),
+            default=None,
+        )
+        return best[1] if best is not None else None
+    return next((s for k, s in _KEYWORD_ITEMS if k in subject_lower), None)
+
 
 def infer_step_from_task(task_subject: str) -> int:
     """Infer the workflow step from task subject."""
     subject_lower = task_subject.lower()
 
-    for keyword, step in TASK_TO_STEP.items():
-        if keyword in subject_lower:
-            return step
+    step = _match_keyword(subject_lower)
+    if step is not None:
+        return step
 
     # Check for "Step N" pattern
-    import re
-    match = re.search(r'step\s*(\d+)', subject_lower)
+    match = _STEP_RE.search(subject_lower)
     if match:
         return int(match.group(1))
 
@@ -59,9 +84,8 @@ def infer_step_from_task(task_subject: str) -> int:
 
 
 def main():
-    manager = get_manager()
-
-    # Read tool input from stdin
+    # Read tool input from stdin before touching state, so no-op
+    # invocations exit without any disk I/O
     try:
         tool_input = json.loads(sys.stdin.read())
         task_id = tool_input.get("taskId", "")
@@ -71,6 +95,11 @@ def main():
         # Can't parse input, just exit
         sys.exit(0)
 
+    if new_status not in ("completed", "in_progress"):
+        sys.exit(0)
+
+    manager = get_manager()
+
     # If task was completed, check if it advances the workflow
     if new_status == "completed":
         inferred_step = infer_step_from_task(subject)
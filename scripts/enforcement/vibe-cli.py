@@ -19,11 +19,8 @@ Usage:
 """
 
 import sys
-import os
 import argparse
-
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from copy import deepcopy
 
 from state_manager import get_manager
 from config import DEFAULT_STATE
@@ -111,8 +108,8 @@ def cmd_reset(args):
     backup = manager.backup(reason="pre_reset")
     print(f"[BACKUP] Created: {backup}")
 
-    # Reset state
-    manager.state = DEFAULT_STATE.copy()
+    # Reset state (deep copy so DEFAULT_STATE's nested dicts stay pristine)
+    manager.state = deepcopy(DEFAULT_STATE)
     manager.save()
     print("[OK] Workflow state reset to initial")
 